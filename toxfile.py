@@ -1,13 +1,18 @@
 """Project-local tox env customizations."""
 
-from base64 import b64encode
-from functools import cached_property
+from binascii import b2a_base64
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from hashlib import sha256
+from json import dumps as render_json, loads as parse_json
 from logging import getLogger
-from os import environ, getenv
+from mmap import ACCESS_READ, mmap
+from os import DirEntry, environ, getenv, scandir
 from pathlib import Path
 from sys import path as _sys_path
+from types import ModuleType
 from typing import cast
+from weakref import WeakKeyDictionary
 
 from tox.config.types import Command
 from tox.execute.request import StdinSource
@@ -25,42 +30,94 @@ from tox.tox_env.python.virtual_env.runner import VirtualEnvRunner
 from tox.tox_env.register import ToxEnvRegister
 
 
-_sys_path[:0] = ['bin/']  # noqa: WPS362
+@lru_cache(maxsize=None)
+def _pip_constraint_helpers() -> ModuleType:
+    """Import the in-repo pip constraint helpers on first use.
+
+    Deferring the ``sys.path`` injection until the pinned installer
+    actually needs the helpers keeps it from leaking into unrelated
+    tox invocations and plugins.
+    """
+    _sys_path.insert(0, str(_BIN_DIR))
+    # pylint: disable-next=import-outside-toplevel
+    import pip_constraint_helpers  # noqa: WPS433
+    return pip_constraint_helpers
+
+
+# Both helpers are pure functions of their inputs (and of the
+# interpreter running tox), so repeat lookups within one process
+# collapse into dict hits:
+@lru_cache(maxsize=None)
+def _cached_constraint_file_path(
+        req_dir: str, toxenv: str, python_tag: str,
+) -> Path:
+    return _pip_constraint_helpers().get_constraint_file_path(
+        req_dir=req_dir,
+        toxenv=toxenv,
+        python_tag=python_tag,
+    )
 
-# pylint: disable-next=wrong-import-position
-from pip_constraint_helpers import (  # noqa: E402
-    get_constraint_file_path, get_runtime_python_tag,
-)
+
+@lru_cache(maxsize=None)
+def _cached_runtime_python_tag() -> str:
+    return _pip_constraint_helpers().get_runtime_python_tag()
 
 
 IS_GITHUB_ACTIONS_RUNTIME = getenv('GITHUB_ACTIONS') == 'true'
-FILE_APPEND_MODE = 'a'
+BINARY_FILE_APPEND_MODE = 'ab'
 UNICODE_ENCODING = 'utf-8'
 _PINNED_PREFIX = 'pinned-'
+_GIT_EXECUTABLE = 'git'
+_GIT_LOG_CMD = (
+    _GIT_EXECUTABLE,
+    '-c', 'core.pager=',  # prevents ANSI escape sequences
+    'log',
+    '-1',
+    '--pretty=%ct',  # noqa: WPS323
+)
+_DIST_SUFFIXES = '.whl', '.tar.gz'
+_READ_BUFFER_SIZE = 1 << 18  # noqa: WPS432 -- 256 KiB
+_MMAP_SIZE_THRESHOLD = 1 << 20  # noqa: WPS432 -- 1 MiB
+
+_sha256_cache: dict[str, str] = {}
 
 
 logger = getLogger(__name__)
 
 
+_HERE = Path(__file__).resolve().parent
+_BIN_DIR = _HERE / 'bin'
+_DIST_DIR = _HERE / 'dist'
+# The cache lives in the tox work dir and not in `dist/` because the
+# `build-dists` env wipes `dist/` at the start of every run:
+_SHA256_CACHE_FILE_PATH = _HERE / '.tox' / '.sha256cache.json'
+
+
 @impl
 def tox_before_run_commands(tox_env: ToxEnv) -> None:
     """Inject SOURCE_DATE_EPOCH env var into build-dists."""
     if tox_env.name == 'build-dists':
+        preset_epoch = environ.get('SOURCE_DATE_EPOCH')
+        if preset_epoch is not None:
+            logger.debug(
+                'toxfile:tox_before_run_commands> Reusing the '  # noqa: WPS323
+                '`SOURCE_DATE_EPOCH=%s` environment variable already '
+                'present in the outer environment. Not invoking Git...',
+                preset_epoch,
+            )
+            tox_env.environment_variables['SOURCE_DATE_EPOCH'] = preset_epoch
+            return
+
         logger.debug(
             'toxfile:tox_before_run_commands> Setting the Git HEAD-based '
             'epoch for reproducibility in GHA...',
         )
-        git_executable = 'git'
-        git_log_cmd = (
-            git_executable,
-            '-c', 'core.pager=',  # prevents ANSI escape sequences
-            'log',
-            '-1',
-            '--pretty=%ct',  # noqa: WPS323
-        )
-        tox_env.conf['allowlist_externals'].append(git_executable)
-        git_log_outcome = tox_env.execute(git_log_cmd, StdinSource.OFF)
-        tox_env.conf['allowlist_externals'].pop()
+        allowlist_externals = tox_env.conf['allowlist_externals']
+        allowlist_externals.append(_GIT_EXECUTABLE)
+        try:
+            git_log_outcome = tox_env.execute(_GIT_LOG_CMD, StdinSource.OFF)
+        finally:
+            allowlist_externals.pop()
         if git_log_outcome.exit_code:
             logger.warning(
                 'Failed to look up Git HEAD timestamp. %s',  # noqa: WPS323
@@ -78,13 +135,106 @@ def tox_before_run_commands(tox_env: ToxEnv) -> None:
         tox_env.environment_variables['SOURCE_DATE_EPOCH'] = git_head_timestamp
 
 
-def _compute_sha256sum(file_path: Path) -> str:
-    return sha256(file_path.read_bytes()).hexdigest()
+def _load_sha256_cache(cache_file_path: Path) -> None:
+    try:
+        cached_digests = parse_json(
+            cache_file_path.read_text(encoding=UNICODE_ENCODING),
+        )
+    except (OSError, ValueError):
+        return
+    _sha256_cache.update(cached_digests)
 
 
-def _produce_sha256sum_line(file_path: Path) -> str:
-    sha256_str = _compute_sha256sum(file_path)
-    return f'{sha256_str !s}  {file_path.name !s}'
+def _save_sha256_cache(cache_file_path: Path) -> None:
+    try:
+        cache_file_path.write_text(
+            render_json(_sha256_cache),
+            encoding=UNICODE_ENCODING,
+        )
+    except OSError as write_err:
+        logger.debug(
+            'toxfile> Failed to persist the SHA-256 '  # noqa: WPS323
+            'cache at `%s`: %s',
+            cache_file_path,
+            write_err,
+        )
+
+
+def _compute_sha256sum(dist_dir_entry: DirEntry[str]) -> str:
+    file_stat = dist_dir_entry.stat()  # cached by `scandir()`, no syscall
+    cache_key = (
+        f'{dist_dir_entry.name !s}:'
+        f'{file_stat.st_mtime_ns !s}:{file_stat.st_size !s}'
+    )
+    try:
+        return _sha256_cache[cache_key]
+    except KeyError:
+        sha256_str = _stream_sha256sum(
+            dist_dir_entry.path, file_stat.st_size,
+        )
+        _sha256_cache[cache_key] = sha256_str
+        return sha256_str
+
+
+def _stream_sha256sum(file_path: str, file_size: int) -> str:
+    sha256_hash = sha256()
+    with open(file_path, 'rb', buffering=0) as dist_file:  # noqa: WPS515
+        if file_size >= _MMAP_SIZE_THRESHOLD:
+            # Digest straight out of the page cache — the kernel handles
+            # read-ahead and no Python-side buffering happens at all:
+            with mmap(
+                    dist_file.fileno(), 0, access=ACCESS_READ,
+            ) as mapped_artifact:
+                sha256_hash.update(mapped_artifact)
+            return sha256_hash.hexdigest()
+
+        read_buffer = memoryview(bytearray(_READ_BUFFER_SIZE))
+        while chunk_size := dist_file.readinto(read_buffer):  # noqa: WPS332
+            sha256_hash.update(read_buffer[:chunk_size])
+    return sha256_hash.hexdigest()
+
+
+@lru_cache(maxsize=None)
+def _github_output_file_path() -> Path:
+    return Path(environ['GITHUB_OUTPUT'])
+
+
+def _produce_sha256sum_line(dist_dir_entry: DirEntry[str]) -> bytes:
+    sha256_str = _compute_sha256sum(dist_dir_entry)
+    return f'{sha256_str !s}  {dist_dir_entry.name !s}'.encode('ascii')
+
+
+def _enumerate_dist_artifacts() -> list[DirEntry[str]]:
+    try:
+        dists_dir_iterator = scandir(_DIST_DIR)
+    except FileNotFoundError:
+        # `dist/` may be absent if the build bailed right after wiping
+        # it — degrade to an empty manifest like the old glob did:
+        return []
+    with dists_dir_iterator:
+        return sorted(
+            (
+                dist_dir_entry
+                for dist_dir_entry in dists_dir_iterator
+                if dist_dir_entry.is_file(follow_symlinks=False)
+                and dist_dir_entry.name.endswith(_DIST_SUFFIXES)
+            ),
+            key=lambda dist_dir_entry: dist_dir_entry.name,
+        )
+
+
+def _produce_sha256sum_output() -> bytes:
+    _load_sha256_cache(_SHA256_CACHE_FILE_PATH)
+    artifact_entries = _enumerate_dist_artifacts()
+    # OpenSSL-backed `sha256` releases the GIL on big buffers so the
+    # artifacts get digested on multiple cores. The pre-sorted paths
+    # keep the manifest (and the combined hash) order-stable.
+    with ThreadPoolExecutor() as hashing_executor:
+        emulated_sha256sum_output = b'\n'.join(
+            hashing_executor.map(_produce_sha256sum_line, artifact_entries),
+        )
+    _save_sha256_cache(_SHA256_CACHE_FILE_PATH)
+    return emulated_sha256sum_output
 
 
 @impl
@@ -95,39 +245,42 @@ def tox_after_run_commands(tox_env: ToxEnv) -> None:
             'toxfile:tox_after_run_commands> Computing and storing the base64 '
             'representation of the combined dists SHA-256 hash in GHA...',
         )
-        dists_dir_path = Path(__file__).parent / 'dist'
-        emulated_sha256sum_output = '\n'.join(
-            _produce_sha256sum_line(artifact_path)
-            for artifact_path in dists_dir_path.glob('*')
+        emulated_sha256sum_output = _produce_sha256sum_output()
+        emulated_base64_w0_output = b2a_base64(
+            emulated_sha256sum_output, newline=False,
         )
-        emulated_base64_w0_output = b64encode(
-            emulated_sha256sum_output.encode(),
-        ).decode()
 
-        with Path(environ['GITHUB_OUTPUT']).open(
-            encoding=UNICODE_ENCODING,
-            mode=FILE_APPEND_MODE,
+        with _github_output_file_path().open(
+            mode=BINARY_FILE_APPEND_MODE,
         ) as outputs_file:
-            print(  # noqa: WPS421
-                'combined-dists-base64-encoded-sha256-hash='
-                f'{emulated_base64_w0_output !s}',
-                file=outputs_file,
+            outputs_file.write(
+                b'combined-dists-base64-encoded-sha256-hash='  # noqa: WPS323
+                b'%s\n' % emulated_base64_w0_output,
             )
 
 
 class PinnedPipInstaller(PipInstaller):
     """A constraint-aware pip installer."""
 
-    _non_existing_constraint_files: set[Path] = set()
+    # Maps `(toxenv, python_tag)` to whether its constraints file
+    # exists. Keying on the two strings makes the hot lookup a cheap
+    # tuple hash instead of a `PurePath` traversal:
+    _constraint_status: dict[tuple[str, str], bool] = {}
 
     def post_process_install_command(self, cmd: Command) -> Command:
         """Inject an env-specific constraint into pip install."""
-        constraint_file_path = get_constraint_file_path(
+        python_tag = _cached_runtime_python_tag()
+        constraint_file_path = _cached_constraint_file_path(
             req_dir='dependencies/lock-files/',
             toxenv=self._env.name,
-            python_tag=get_runtime_python_tag(),
+            python_tag=python_tag,
         )
         constraint_cli_arg = f'--constraint={constraint_file_path !s}'
+        constraint_file_exists, first_constraint_resolution = (
+            self._resolve_constraint_file_existence(
+                (self._env.name, python_tag), constraint_file_path,
+            )
+        )
         if constraint_cli_arg in cmd.args:
             logger.debug(
                 'tox-lock:%s> `%s` CLI option is already a '  # noqa: WPS323
@@ -135,7 +288,7 @@ class PinnedPipInstaller(PipInstaller):
                 self._env.name,
                 constraint_cli_arg,
             )
-        elif constraint_file_path.is_file():
+        elif constraint_file_exists:
             logger.info(
                 'tox-lock:%s> Applying the pinned constraints '  # noqa: WPS323
                 'file `%s` to the current env...',  # noqa: WPS323
@@ -149,28 +302,57 @@ class PinnedPipInstaller(PipInstaller):
                 constraint_cli_arg,
             )
             cmd.args.append(constraint_cli_arg)
-        else:
-            if constraint_file_path not in self._non_existing_constraint_files:
-                logger.warning(
-                    'tox-lock:%s> The expected pinned '  # noqa: WPS323
-                    'constraints file for the current env does not exist '
-                    '(should be `%s`). Skipping...',  # noqa: WPS323
-                    self._env.name,
-                    constraint_file_path,
-                )
-            self._non_existing_constraint_files.add(constraint_file_path)
+        elif first_constraint_resolution:
+            logger.warning(
+                'tox-lock:%s> The expected pinned '  # noqa: WPS323
+                'constraints file for the current env does not exist '
+                '(should be `%s`). Skipping...',  # noqa: WPS323
+                self._env.name,
+                constraint_file_path,
+            )
 
         return super().post_process_install_command(cmd)
 
+    def _resolve_constraint_file_existence(
+            self,
+            constraint_status_key: tuple[str, str],
+            constraint_file_path: Path,
+    ) -> tuple[bool, bool]:
+        """Look up whether the constraints file exists, caching it.
+
+        :param constraint_status_key: tox env name and Python tag pair.
+        :param constraint_file_path: Path to the constraints file.
+        :returns: The existence flag, paired with whether this was the
+                  first resolution for the given key.
+        """
+        cached_status = self._constraint_status.get(constraint_status_key)
+        if cached_status is not None:
+            return cached_status, False
+        constraint_file_exists = constraint_file_path.is_file()
+        self._constraint_status[constraint_status_key] = (
+            constraint_file_exists
+        )
+        return constraint_file_exists, True
+
+
+_pinned_installers: WeakKeyDictionary[
+    'PinnedPipInstallerSelectedMixin', PinnedPipInstaller,
+] = WeakKeyDictionary()
+
 
 # pylint: disable-next=too-few-public-methods
 class PinnedPipInstallerSelectedMixin:
     """A base class with pinned pip installer."""
 
-    @cached_property
+    @property
     def installer(self) -> PinnedPipInstaller:
         """Return a constraint-aware pip installer."""
-        return PinnedPipInstaller(cast(Python, self))
+        try:
+            return _pinned_installers[self]
+        except KeyError:
+            pinned_installer = PinnedPipInstaller(cast(Python, self))
+            _pinned_installers[self] = pinned_installer
+            return pinned_installer
 
 
 # pylint: disable-next=too-many-ancestors